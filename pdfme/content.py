@@ -1,3 +1,4 @@
+from copy import copy as shallow_copy
 from typing import Optional, Union
 
 TABLE_PROPERTIES = ('widths', 'borders', 'fills')
@@ -5,6 +6,18 @@ PARAGRAPH_PROPERTIES = (
     'text_align', 'line_height', 'indent',
     'list_text', 'list_style', 'list_indent'
 )
+_TABLE_KEYS = frozenset(TABLE_PROPERTIES)
+_PARAGRAPH_KEYS = frozenset(PARAGRAPH_PROPERTIES)
+# answer of the process methods when the element was added. It's shared, so
+# it must not be modified.
+_ADDED = {'delayed': None, 'next': False}
+
+# the balancing passes of a content box. The search halves its step
+# (minim_diff) on every pass and ends when the step is under 1, which for a box
+# as tall as a page takes about 10 passes, so the rest are left for the passes
+# going back up after a step under 1 didn't fit. If this limit is reached
+# first, the search is cut short and the shortest columns that fit are kept.
+_MAX_RESETS = 16
 
 Number = Union[float, int]
 StrOrDict = Union[str, dict]
@@ -190,6 +203,10 @@ class PDFContent:
         self.fonts = fonts
         self.current_height = 0
         self.pdf = pdf
+        self._named_style_cache = {}
+        self._text_cache = {}
+        self._layout_cache = {}
+        self._image_cache = {}
 
     def setup(
         self, x: Number=None, y: Number=None, width: Number=None,
@@ -242,6 +259,8 @@ class PDFContent:
         self.fills = []
         self.lines = []
         self.parts = []
+        self._text_cache = {}
+        self._layout_cache = {}
         content_part = self.pdf_content_part
         if content_part is None:
             self.pdf_content_part = content_part = PDFContentPart(
@@ -322,6 +341,18 @@ class PDFContentPart:
     Raises:
         TypeError: If content is not a dict
     """
+    __slots__ = (
+        'p', 'parent', 'is_root', 'last', 'style', 'elements', 'column_info',
+        'cols_n', 'cols_gap', 'col_width', 'min_x', 'min_y', 'max_y', 'x',
+        'y', 'width', 'full_width', 'max_height', 'column', 'column_x',
+        'starting',
+        'last_bottom', 'section_element_index', 'section_delayed',
+        'element_index', 'delayed', 'children_memory',
+        'partial_children_memory', 'will_reset', 'resetting', 'parts_index',
+        'lines_index', 'fills_index', 'minim_diff_last', 'minim_diff',
+        'minim_forward', 'infeasible_height', 'resets', 'fit_height', 'seeded'
+    )
+
     def __init__(
             self, content: dict, pdf_content: PDFContent, min_x: Number,
             width: Number, min_y: Number, max_y: Number,
@@ -338,10 +369,11 @@ class PDFContentPart:
                 '"content" arg must be a dict:'.format(content)
             )
 
-        self.style = {'margin_bottom': 5}
         inherited_style = {} if inherited_style is None else inherited_style
-        self.style.update(inherited_style)
-        self.style.update(process_style(content.get('style'), self.p.pdf))
+        self.style = {
+            'margin_bottom': 5, **inherited_style,
+            **self.process_style(content.get('style'))
+        }
 
         self.column_info = content.get('cols', {})
 
@@ -372,6 +404,12 @@ class PDFContentPart:
         """
         self.min_x = min_x
         self.min_y = min_y
+
+        self.cols_n = self.column_info.get('count', 1)
+        self.cols_gap = self.column_info.get('gap', max(width / 25, 7))
+        cols_spaces = self.cols_gap * (self.cols_n - 1)
+        self.col_width = (width - cols_spaces) / self.cols_n
+
         self.go_to_beginning()
 
         self.full_width = width
@@ -379,20 +417,21 @@ class PDFContentPart:
         self.max_height = self.y - self.max_y
         self.last_bottom = 0
 
-        self.cols_n = self.column_info.get('count', 1)
-        self.cols_gap = self.column_info.get('gap', max(width / 25, 7))
-        cols_spaces = self.cols_gap * (self.cols_n - 1)
-        self.col_width = (width - cols_spaces) / self.cols_n
-
         self.element_index = self.section_element_index # current index
-        self.delayed = copy(self.section_delayed) # current delayed elements
+        self.delayed = list(self.section_delayed) # current delayed elements
         self.will_reset = False
         self.resetting = False
         self.parts_index = len(self.p.parts)
+        self.lines_index = len(self.p.lines)
+        self.fills_index = len(self.p.fills)
 
         self.minim_diff_last = None
         self.minim_diff = None
         self.minim_forward = None
+        self.infeasible_height = 0
+        self.resets = 0
+        self.fit_height = None
+        self.seeded = False
 
     def get_state(self) -> dict:
         """Method to get the current state of this content box. This can be used
@@ -405,8 +444,8 @@ class PDFContentPart:
         """
         return {
             'section_element_index': self.section_element_index,
-            'section_delayed': copy(self.section_delayed),
-            'children_memory': copy(self.children_memory)
+            'section_delayed': list(self.section_delayed),
+            'children_memory': list(self.children_memory)
         }
 
     def set_state(
@@ -428,8 +467,8 @@ class PDFContentPart:
                 content boxes inside this content box are.
         """
         self.section_element_index = section_element_index
-        self.section_delayed = copy(section_delayed)
-        self.children_memory = copy(children_memory)
+        self.section_delayed = list(section_delayed)
+        self.children_memory = list(children_memory)
 
     def add_delayed(self) -> str:
         '''Function to add the delayed elements to the rectangle.
@@ -443,22 +482,34 @@ class PDFContentPart:
             any of the strings mentioned in
             :meth:`pdfme.content.PDFContentPart.add_elements`.
         '''
-        n = 0
-        while n < len(self.delayed):
-            ret = self.process(copy(self.delayed[n]), False)
+        # delayed elements are never content boxes, so nothing reads
+        # self.delayed while this loop runs, and the elements that are kept
+        # can be moved to the front of the list, behind the cursor ``n``,
+        # instead of popping the added ones. The delayed dicts are never
+        # modified (they are copied before being processed), so the snapshots
+        # of this list only need to copy the list itself.
+        delayed, process = self.delayed, self.process
+        kept = n = 0
+        while n < len(delayed):
+            ret = process(copy(delayed[n]), False)
             if ret in ['interrupt', 'break', 'partial_next']:
+                del delayed[kept:n]
                 return ret
 
             if ret.get('delayed'):
-                self.delayed[n] = copy(ret['delayed'])
+                delayed[n] = ret['delayed']
+                if ret.get('flow', False):
+                    delayed[kept] = delayed[n]
+                    kept += 1
+                    n += 1
             else:
-                self.delayed.pop(n)
+                n += 1
 
             if ret.get('next', False):
+                del delayed[kept:n]
                 return 'next'
 
-            if ret.get('flow', False):
-                n += 1
+        del delayed[kept:]
 
         if (
             len(self.delayed) > 0 and
@@ -502,16 +553,23 @@ class PDFContentPart:
               elements (there could be delayed elements still).
 
         '''
-        len_elems = len(self.elements) - 1
+        # element_index is kept in the instance, because next_section reads
+        # it from the children while they are being processed. The delayed
+        # list is only replaced in reset, after this method returns.
+        elements, process = self.elements, self.process
+        append_delayed = self.delayed.append
+        len_elems = len(elements) - 1
         while self.element_index <= len_elems:
-            last = self.element_index == len_elems
-            ret = self.process(self.elements[self.element_index], last=last)
+            element_index = self.element_index
+            ret = process(
+                elements[element_index], last=element_index == len_elems
+            )
             if ret in ['interrupt', 'break', 'partial_next']:
                 return ret
 
             self.element_index += 1
             if ret.get('delayed'):
-                self.delayed.append(ret['delayed'])
+                append_delayed(ret['delayed'])
 
             if ret.get('next', False):
                 return 'next'
@@ -587,9 +645,16 @@ class PDFContentPart:
             if not self.resetting and self.cols_n > 1:
                 if self.last_child_of_resetting():
                     break
+                if self.starting and self.column == 0:
+                    # nothing was placed, so there is nothing to balance
+                    self.max_y = self.min_y
+                    break
                 self.start_resetting()
                 if self.will_reset:
-                    self.reset()
+                    self.reset(
+                        self.column * (self.min_y - self.max_y) +
+                        self.min_y - self.y
+                    )
                 else:
                     return 'break'
             elif self.resetting:
@@ -602,7 +667,7 @@ class PDFContentPart:
         return 'continue'
 
     def last_child_of_resetting(self) -> bool:
-        """Function that recursively, towards the ancestors, checks if this
+        """Function that walks towards the ancestors, checking if this
         element is the last element of the last element of one ancestor that
         is resetting.
 
@@ -610,14 +675,13 @@ class PDFContentPart:
             True if this element is the last element of an ancestor that is
             resetting.
         """
-        parent = self.parent
-        if parent:
-            if self.last:
-                if parent.resetting:
-                    parent.mimim_forward = False
-                    return True
-                else:
-                    return parent.last_child_of_resetting()
+        node = self
+        while node.parent and node.last:
+            parent = node.parent
+            if parent.resetting:
+                parent.minim_forward = False
+                return True
+            node = parent
         return False
 
     def start_resetting(self) -> None:
@@ -625,33 +689,82 @@ class PDFContentPart:
         one of its ancestors to True.
         """
 
-        parent = self.parent
-        if parent and self.last  and parent.cols_n > 1:
-            parent.start_resetting()
-            return
+        node = self
+        while node.parent and node.last and node.parent.cols_n > 1:
+            node = node.parent
 
-        self.will_reset = True
+        node.will_reset = True
 
-    def reset(self) -> None:
+    def reset(self, content_height: Number=None) -> None:
         """Function that first checks if resetting process is over, and if not
         calculates a new value for attribute ``max_y`` and resets all of the
         elements added to the rectangle so far to repeat the arranging process.
 
+        Args:
+            content_height (int, float, optional): If this element has just
+                arranged all of its elements in columns of the full height,
+                the sum of the heights used in every column. This is used to
+                start the process with the height the columns would have if
+                the content was evenly divided among them.
+
         Returns:
             True if resetting process should continue or False if this process
             is done.
         """
-        if self.minim_diff_last and self.minim_diff_last - self.minim_diff < 1:
+        height = self.min_y - self.max_y
+        if not self.minim_forward and (
+            self.fit_height is None or height < self.fit_height
+        ):
+            self.fit_height = height
+
+        self.resets += 1
+        if self.resets > _MAX_RESETS:
+            if not self.minim_forward:
+                return False
+            # the last columns were too short, so they are arranged once more
+            # with the shortest height that fit.
+            self.max_y = self.min_y - self.fit_height
+            self.restart()
+            return True
+
+        if self.seeded:
+            self.seeded = False
+            # the evenly divided height includes the space left unused at the
+            # bottom of the columns, so the columns may be shorter than that,
+            # and if the content fits, the search goes on below it.
+            if not self.minim_forward:
+                self.minim_diff = height
+
+        if (
+            self.minim_diff_last is not None and
+            self.minim_diff_last - self.minim_diff < 1
+        ):
             if self.minim_forward:
                 self.minim_diff *= 2
             else:
                 return False
 
-        self.will_reset = False
-        self.p.parts = self.p.parts[:self.parts_index]
-        self.go_to_beginning()
-
-        if self.minim_diff is None:
+        if (
+            self.minim_diff is not None and not self.minim_forward and
+            height - self.minim_diff / 2 <= self.infeasible_height
+        ):
+            # the next height is known to be too short, so the middle of the
+            # space left above the greatest of those heights is tried instead.
+            if height - self.infeasible_height < 1:
+                return False
+            self.minim_diff = height - self.infeasible_height
+
+        col_height = None if content_height is None else \
+            content_height / self.cols_n
+        if self.minim_diff is None and col_height is not None and \
+                self.min_y - self.max_y - col_height >= 2:
+            # the evenly divided height is tried first, as if it were a step
+            # down from the full height: if the content doesn't fit, the next
+            # pass goes up half of this step and the search goes on from there.
+            self.minim_diff = self.min_y - self.max_y - col_height
+            self.max_y = self.min_y - col_height
+            self.seeded = True
+        elif self.minim_diff is None:
             self.minim_diff = (self.min_y - self.max_y) / 2
             self.max_y += self.minim_diff
         else:
@@ -662,12 +775,22 @@ class PDFContentPart:
             else:
                 self.max_y += self.minim_diff
 
+        self.restart()
+        return True
+
+    def restart(self) -> None:
+        """Function that removes everything this element added to the content
+        box in the current section, to arrange its elements again.
+        """
+        self.will_reset = False
+        del self.p.parts[self.parts_index:]
+        del self.p.lines[self.lines_index:]
+        del self.p.fills[self.fills_index:]
+        self.go_to_beginning()
         self.resetting = True
 
         self.element_index = self.section_element_index
-        self.delayed = copy(self.section_delayed)
-
-        return True
+        self.delayed = list(self.section_delayed)
 
     def go_to_beginning(self) -> None:
         """Function that takes the x and y coordinates of this element to the
@@ -676,6 +799,9 @@ class PDFContentPart:
         self.y = self.min_y
         self.x = self.min_x
         self.column = 0
+        self.column_x = self.min_x + self.column * (
+            self.col_width + self.cols_gap
+        )
         self.starting = True
 
     def next_section(self, children_memory: list=None) -> StrOrDict:
@@ -699,47 +825,58 @@ class PDFContentPart:
             going to have from now on.
         """
 
-        if self.column == self.cols_n - 1:
-            if self.resetting:
-                self.minim_forward = True
+        from_main_loop = children_memory is None
+        # the ancestors are walked in a loop, and the elements that were in
+        # their last column are moved to the next section at the end.
+        moved = []
+        node = self
+        while node.column == node.cols_n - 1:
+            if node.resetting:
+                node.minim_forward = True
                 return 'break'
+
+            node.section_element_index = node.element_index
+            node.section_delayed = list(node.delayed)
+            # the memory entries and the section snapshot are never
+            # modified, so they can be shared.
+            new_index = (node.element_index, node.section_delayed)
+            if children_memory is None:
+                node.children_memory = []
+                children_memory = [new_index]
             else:
-                self.section_element_index = self.element_index
-                self.section_delayed = copy(self.delayed)
-                new_index = {
-                    'index': self.element_index,
-                    'delayed': copy(self.delayed)
-                }
-                if children_memory is None:
-                    self.children_memory = []
-                    new_children_memory = [new_index]
-                else:
-                    self.children_memory = copy(children_memory)
-                    new_children_memory = copy(children_memory)
-                    new_children_memory.append(new_index)
-
-                if self.is_root:
-                    return 'interrupt'
-
-                ret = self.parent.next_section(new_children_memory)
-                if ret in ['interrupt', 'break', 'partial_next']:
-                    return ret
-                self.min_y = ret['min_y']
-                self.min_x = ret['min_x']
-                self.parts_index = len(self.p.parts)
-                self.go_to_beginning()
-                return 'retry' if children_memory is None else ret
-        else:
-            self.column += 1
-            self.starting = True
-            self.y = self.min_y
+                node.children_memory = children_memory
+                children_memory = children_memory + [new_index]
+
+            if node.is_root:
+                return 'interrupt'
+
+            moved.append(node)
+            node = node.parent
+
+        node.column += 1
+        node.column_x = node.min_x + node.column * (
+            node.col_width + node.cols_gap
+        )
+        node.starting = True
+        node.y = node.min_y
 
-            if len(self.delayed) > 0 and children_memory is not None:
-                self.partial_children_memory = copy(children_memory)
-                return 'partial_next'
+        if len(node.delayed) > 0 and children_memory is not None:
+            node.partial_children_memory = children_memory
+            return 'partial_next'
 
-            return 'retry' if children_memory is None else \
-                {'min_x': self.get_min_x(), 'min_y': self.min_y}
+        if children_memory is None:
+            return 'retry'
+
+        ret = {'min_x': node.get_min_x(), 'min_y': node.min_y}
+        for node in reversed(moved):
+            node.min_y = ret['min_y']
+            node.min_x = ret['min_x']
+            node.parts_index = len(self.p.parts)
+            node.lines_index = len(self.p.lines)
+            node.fills_index = len(self.p.fills)
+            node.go_to_beginning()
+
+        return 'retry' if from_main_loop else ret
 
     def get_min_x(self) -> Number:
         """Function to get the x coordinate of the rectangle depending on the
@@ -748,7 +885,7 @@ class PDFContentPart:
         Returns:
             int, float: The x coordinate.
         """
-        return self.min_x + self.column * (self.col_width + self.cols_gap)
+        return self.column_x
 
     def update_dimensions(self, style: dict) -> None:
         """Function that updates the rectangle dimensions of the child element
@@ -758,10 +895,10 @@ class PDFContentPart:
             style (dict): The style dict that contains the margin information
                 needed to calculate the child element rectangle dimensions.
         """
-        s = style
-        self.x = self.get_min_x() + s.get('margin_left', 0)
-        self.width = self.col_width - \
-            s.get('margin_left', 0) - s.get('margin_right', 0)
+        margin_left = style.get('margin_left', 0)
+        self.x = self.column_x + margin_left
+        self.width = self.col_width - margin_left - \
+            style.get('margin_right', 0)
 
         if not self.starting:
             self.y -= self.last_bottom
@@ -810,10 +947,12 @@ class PDFContentPart:
                 list of child elements of this element.
         '''
         element = self.parse_element(element)
-        style, element_style = self.get_element_styles(element, self.style)
+        par_key = self.get_paragraph_key(element)
+        style, element_style = self.get_element_styles(
+            element, self.style, par_key
+        )
 
-        keys = [key for key in element.keys() if key.startswith('.')]
-        if len(keys) > 0 or 'paragraph' in element:
+        if par_key is not None or 'paragraph' in element:
             return self.process_text(element, style, element_style)
         elif 'image' in element:
             return self.process_image(element, style)
@@ -831,6 +970,11 @@ class PDFContentPart:
         """Function that tries to add a paragraph to the current column
         rectangle, and add the remainder to the delayed list
 
+        When a paragraph fits completely, its result is kept for the current
+        run of the content box, and it's reused if the same paragraph is added
+        again in the same position, with the same width and at least the same
+        height (like when a column is balanced).
+
         Args:
             element (dict): The paragraph to be added
             style (dict): The style of the paragraph, combined with the style
@@ -846,41 +990,57 @@ class PDFContentPart:
 
         self.update_dimensions(style)
 
+        layout_key = laid_out = None
         if 'paragraph' in element:
             pdf_text = element['paragraph']
             pdf_text.setup(self.x, self.y, self.width, self.max_height)
             pdf_text.set_state(**element['state'])
             pdf_text.finished = False
-            remaining = copy(element)
+            remaining = shallow_copy(element)
         else:
             par_style = {
-                v: style.get(v) for v in PARAGRAPH_PROPERTIES if v in style
+                k: style[k] for k in _PARAGRAPH_KEYS.intersection(style)
             }
             element['style'] = style.copy()
-            pdf_text = PDFText(
-                element, self.width, self.max_height, self.x, self.y,
-                fonts=self.p.fonts, pdf=self.p.pdf, **par_style
-            )
-            remaining = {'paragraph': pdf_text, 'style': element_style}
-
-        result = pdf_text.run()
-        remaining['last_part'] = pdf_text.last_part
-        remaining['last_word'] = pdf_text.last_word
-        result['type'] = 'paragraph'
+            key = tuple((k, id(v)) for k, v in element.items() if k != 'style')
+            layout_key = (key, self.x, self.y, self.width)
+            laid_out = self.p._layout_cache.get(layout_key)
+            if laid_out is not None and (
+                laid_out[0] != element['style'] or
+                self.max_height < laid_out[1]
+            ):
+                laid_out = None
+            if laid_out is None:
+                pdf_text = self.get_pdf_text(element, par_style, key)
+                remaining = {'paragraph': pdf_text, 'style': element_style}
+
+        if laid_out is not None:
+            result, current_height, finished = laid_out[2], laid_out[3], True
+        else:
+            result = pdf_text.run()
+            result['type'] = 'paragraph'
+            current_height = pdf_text.current_height
+            finished = pdf_text.finished
+            if finished and layout_key is not None:
+                self.p._layout_cache[layout_key] = (
+                    element['style'], self.max_height, result, current_height
+                )
 
         if add_parts:
             self.p.parts.append(result)
 
-        if pdf_text.current_height > 0:
-            self.y -= pdf_text.current_height
+        if current_height > 0:
+            self.y -= current_height
             self.starting = False
             self.last_bottom = style.get('margin_bottom', 0)
         else:
             self.y = initial_y
 
-        if pdf_text.finished:
-            return {'delayed': None, 'next': False}
+        if finished:
+            return _ADDED
         else:
+            remaining['last_part'] = pdf_text.last_part
+            remaining['last_word'] = pdf_text.last_word
             remaining['state'] = pdf_text.get_state()
             return {'delayed': remaining, 'next': True}
 
@@ -904,11 +1064,7 @@ class PDFContentPart:
 
         self.update_dimensions(style)
 
-        ret = {'delayed': None, 'next': False}
-        pdf_image = PDFImage(
-            element['image'], element.get('extension'),
-            element.get('image_name')
-        )
+        pdf_image = self.get_pdf_image(element)
         width = self.width
         height = width * pdf_image.height / pdf_image.width
         x = self.x
@@ -933,9 +1089,17 @@ class PDFContentPart:
                     'pdf_image': pdf_image, 'type': 'image', 'x': x,
                     'y': self.y, 'width': width, 'height': height
                 })
+            return _ADDED
         else:
             self.y = initial_y
-            if element.setdefault('tries', 0) >= 50:
+            if self.starting and self.resetting:
+                # the image doesn't fit in an empty column, so the columns
+                # must be taller than this.
+                self.infeasible_height = max(
+                    self.infeasible_height, self.min_y - self.max_y
+                )
+            tries = element.get('tries', 0)
+            if tries >= 50:
                 raise Exception(
                     'Image element could not be fitted in the document (try '
                     'adding "min_height" style property to this image for us'
@@ -943,9 +1107,8 @@ class PDFContentPart:
                     ': {}'
                     .format(element)
                 )
-            element['tries'] += 1
             image_place = style.get('image_place', 'flow')
-            ret['delayed'] = element
+            ret = {'delayed': {**element, 'tries': tries + 1}, 'next': False}
             if image_place == 'normal':
                 ret['next'] = True
             elif image_place == 'flow':
@@ -979,11 +1142,10 @@ class PDFContentPart:
             pdf_table.setup(self.x, self.y, self.width, self.max_height)
             pdf_table.set_state(**element['state'])
             pdf_table.finished = False
-            remaining = copy(element)
+            remaining = shallow_copy(element)
         else:
             table_props = {
-                v: element.get(v) for v in TABLE_PROPERTIES
-                if v in element
+                k: element[k] for k in _TABLE_KEYS.intersection(element)
             }
             pdf_table = PDFTable(
                 element['table'], self.p.fonts, self.x, self.y,
@@ -1010,7 +1172,7 @@ class PDFContentPart:
             remaining['state'] = pdf_table.get_state()
             return {'delayed': remaining, 'next': True}
         else:
-            return {'delayed': None, 'next': False}
+            return _ADDED
 
     def process_child(
         self, element: dict, style: dict, last: bool, add_top_margin: bool=True
@@ -1035,7 +1197,7 @@ class PDFContentPart:
 
         pdf_content = PDFContentPart(
             element, self.p, self.get_min_x(), self.col_width, self.y,
-            self.max_y, self, last, style.copy()
+            self.max_y, self, last, style
         )
         down_condition1 = len(self.children_memory) > 0 and \
             self.element_index == self.section_element_index
@@ -1044,10 +1206,11 @@ class PDFContentPart:
         if down_condition1 or down_condition2:
             child = self.children_memory[-1] if down_condition1 else \
                 self.partial_children_memory[-1]
-            pdf_content.section_element_index = child['index']
-            pdf_content.section_delayed = copy(child['delayed'])
-            pdf_content.element_index = child['index']
-            pdf_content.delayed = copy(child['delayed'])
+            index, delayed = child
+            pdf_content.section_element_index = index
+            pdf_content.section_delayed = delayed
+            pdf_content.element_index = index
+            pdf_content.delayed = list(delayed)
             pdf_content.children_memory = self.children_memory[:-1] \
                 if down_condition1 else self.partial_children_memory[:-1]
 
@@ -1070,31 +1233,125 @@ class PDFContentPart:
             return action
         else:
             self.starting = False
-            return {'delayed': None, 'next': False}
+            return _ADDED
 
-    def get_element_styles(self, element: dict, inherited_style: dict):
-        keys = [key for key in element.keys() if key.startswith('.')]
+    def get_paragraph_key(self, element: dict) -> Optional[str]:
+        """Function that returns the first key of ``element`` starting with
+        ``.``, or None if it's not a paragraph.
 
-        style = {}
-        style.update(inherited_style)
-        if len(keys) > 0:
-            style.update(parse_style_str(keys[0][1:], self.p.fonts))
-        element_style = process_style(element.get('style'), self.p.pdf)
-        style.update(element_style)
+        Args:
+            element (dict): The element.
+
+        Returns:
+            str, None: the paragraph key.
+        """
+        return next((key for key in element if key.startswith('.')), None)
+
+    def get_element_styles(
+        self, element: dict, inherited_style: dict, par_key: Optional[str]
+    ):
+        element_style = self.process_style(element.get('style'))
+        if par_key is not None:
+            style = {
+                **inherited_style,
+                **parse_style_str(par_key[1:], self.p.fonts),
+                **element_style
+            }
+        else:
+            style = {**inherited_style, **element_style}
         return style, element_style
 
+    def process_style(self, style: StrOrDict) -> dict:
+        """Function that calls :func:`pdfme.utils.process_style` with the PDF
+        of this content box, reusing the style dict of a named style if it was
+        already taken from the PDF ``formats`` in this content box, and the
+        empty style of the elements without style.
+
+        The dict returned must not be modified.
+
+        Args:
+            style (str, dict, None): a style name (str) or a style dict.
+
+        Returns:
+            dict: a style dict.
+        """
+        if style is not None and not isinstance(style, str):
+            return process_style(style, self.p.pdf)
+        cache = self.p._named_style_cache
+        named_style = cache.get(style)
+        if named_style is None:
+            named_style = cache[style] = process_style(style, self.p.pdf)
+        return named_style
+
+    def get_pdf_text(
+        self, element: dict, par_style: dict, key: tuple
+    ) -> 'PDFText':
+        """Function that creates the :class:`pdfme.text.PDFText` for a
+        paragraph at the current position.
+
+        When a column is balanced the same paragraphs are laid out several
+        times, so a copy of the parsed paragraph is kept for each element in
+        the current run of the content box, and it's reused if the element and
+        its style didn't change.
+
+        Args:
+            element (dict): The paragraph to be added, with its combined style.
+            par_style (dict): The paragraph properties of the style.
+            key (tuple): The ids of the paragraph values, other than the style.
+
+        Returns:
+            PDFText: a paragraph that hasn't been run yet.
+        """
+        values = [v for k, v in element.items() if k != 'style']
+        cached = self.p._text_cache.get(key)
+        if cached is not None and cached[1] == element['style']:
+            pdf_text = shallow_copy(cached[2])
+            pdf_text.setup(self.x, self.y, self.width, self.max_height)
+            return pdf_text
+
+        pdf_text = PDFText(
+            element, self.width, self.max_height, self.x, self.y,
+            fonts=self.p.fonts, pdf=self.p.pdf, **par_style
+        )
+        self.p._text_cache[key] = (
+            values, element['style'], shallow_copy(pdf_text)
+        )
+        return pdf_text
+
+    def get_pdf_image(self, element: dict) -> 'PDFImage':
+        """Function that creates the :class:`pdfme.image.PDFImage` for an
+        image element, reusing the one created before in this content box for
+        the same image, so the image is read only once.
+
+        Args:
+            element (dict): The image element.
+
+        Returns:
+            PDFImage: the image.
+        """
+        key = (
+            element['image'], element.get('extension'),
+            element.get('image_name')
+        )
+        pdf_image = self.p._image_cache.get(key)
+        if pdf_image is None:
+            pdf_image = self.p._image_cache[key] = PDFImage(*key)
+        return pdf_image
+
     def process_group_element(
         self, element: dict, inherited_style: dict, add_element: bool=False,
         add_top_margin: bool=True, min_height: Optional[Number] = None
     ):
         element = self.parse_element(element)
-        style, element_style = self.get_element_styles(element, inherited_style)
+        par_key = self.get_paragraph_key(element)
+        style, element_style = self.get_element_styles(
+            element, inherited_style, par_key
+        )
 
         if min_height is not None:
             style['min_height'] = min_height
 
-        keys = [key for key in element.keys() if key.startswith('.')]
-        if len(keys) > 0 or 'paragraph' in element:
+        if par_key is not None or 'paragraph' in element:
             return self.process_text(
                 element, style, element_style, add_element, add_top_margin
             )
@@ -1135,7 +1392,9 @@ class PDFContentPart:
 
         for i, element in enumerate(group_element['group']):
             if isinstance(element, dict) and 'image' in element:
-                image_style, _ = self.get_element_styles(element, style)
+                image_style, _ = self.get_element_styles(
+                    element, style, self.get_paragraph_key(element)
+                )
                 if 'min_height' in image_style:
                     min_height = image_style['min_height']
                     images[i] = min_height
@@ -1145,14 +1404,17 @@ class PDFContentPart:
                 element, style, add_element=False, add_top_margin=i != 0
             )
             if not (isinstance(ans, dict) and ans.get('delayed') is None):
-                if group_element.setdefault('tries', 0) >= 50:
+                tries = group_element.get('tries', 0)
+                if tries >= 50:
                     raise Exception(
                         'Group element could not be fitted in the document: {}'
                         .format(group_element)
                     )
-                group_element['tries'] += 1
                 self.y = initial_y
-                return {'delayed': group_element, 'next': False, 'flow': True}
+                return {
+                    'delayed': {**group_element, 'tries': tries + 1},
+                    'next': False, 'flow': True
+                }
 
         new_images_size = images_size + self.y - self.max_y
         image_ratio = new_images_size / images_size if len(images) else 1
@@ -1168,7 +1430,7 @@ class PDFContentPart:
                 min_height=min_height
             )
 
-        return {'delayed': None, 'next': False}
+        return _ADDED
 
 from .fonts import PDFFonts
 from .image import PDFImage
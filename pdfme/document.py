@@ -1,4 +1,5 @@
 from collections import defaultdict
+from itertools import chain
 from typing import Any, Iterable, Union
 
 from pdfme.utils import parse_range_string
@@ -186,6 +187,17 @@ class PDFDocument:
         for range_dict in document.get('per_page', []):
             new_range_dict = copy(range_dict)
             new_range_dict['pages'] = parse_range_string(range_dict['pages'])
+            if 'style' in range_dict:
+                page_style = range_dict['style']
+                new_range_dict['style'] = {
+                    k: page_style[k] for k in PAGE_PROPS if k in page_style
+                }
+            if 'running_sections' in range_dict:
+                per_page_rs = range_dict['running_sections']
+                new_range_dict['running_sections'] = {
+                    'exclude': set(per_page_rs.get('exclude', [])),
+                    'include': set(per_page_rs.get('include', []))
+                }
             self.per_page.append(new_range_dict)
 
         self.sections = document.get('sections', [])
@@ -193,6 +205,8 @@ class PDFDocument:
         self.x = self.y = self.width = self.height = 0
 
         self.footnotes = []
+        self._footnote_ids = {}
+        self._last_footnotes = None
         self._traverse_document_footnotes(self.sections)
 
         self.footnotes_margin = 10
@@ -209,36 +223,55 @@ class PDFDocument:
         Raises:
             TypeError:
         """
-        if isinstance(element, (list, tuple)):
-            for child in element:
-                self._traverse_document_footnotes(child)
-        elif isinstance(element, dict):
-            if 'footnote' in element:
-                element.setdefault('ids', [])
-                name = '$footnote:' + str(len(self.footnotes))
-                element['ids'].append(name)
-                element['style'] = '$footnote'
-                element['var'] = name
-                self.pdf.context[name] = '0'
-
-                footnote = element['footnote']
-
-                if not isinstance(footnote, (dict, str, list, tuple)):
-                    footnote = str(footnote)
-                if isinstance(footnote, (str, list, tuple)):
-                    footnote = {'.': footnote}
-
-                if not isinstance(footnote, dict):
-                    raise TypeError(
-                        'footnotes must be of type dict, str, list or tuple:{}'
-                        .format(footnote)
-                    )
-
-                self.footnotes.append(footnote)
+        # the tree is walked with a stack of iterators instead of recursion,
+        # so the footnotes are still numbered in document order.
+        stack = [iter((element,))]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, (list, tuple)):
+                    stack.append(iter(child))
+                    break
+                elif isinstance(child, dict):
+                    if 'footnote' in child:
+                        self._add_document_footnote(child)
+                    else:
+                        stack.append(iter(child.values()))
+                        break
             else:
-                for value in element.values():
-                    if isinstance(value, (list, tuple, dict)):
-                        self._traverse_document_footnotes(value)
+                stack.pop()
+
+    def _add_document_footnote(self, element: dict) -> None:
+        """Method to prepare a footnote dict found in the document sections,
+        for being processed by the inner PDF instance.
+
+        Args:
+            element (dict): the dict with the footnote.
+
+        Raises:
+            TypeError: if the footnote is not of type dict, str, list or tuple.
+        """
+        element.setdefault('ids', [])
+        name = '$footnote:' + str(len(self.footnotes))
+        self._footnote_ids[name] = len(self.footnotes)
+        element['ids'].append(name)
+        element['style'] = '$footnote'
+        element['var'] = name
+        self.pdf.context[name] = '0'
+
+        footnote = element['footnote']
+
+        if not isinstance(footnote, (dict, str, list, tuple)):
+            footnote = str(footnote)
+        if isinstance(footnote, (str, list, tuple)):
+            footnote = {'.': footnote}
+
+        if not isinstance(footnote, dict):
+            raise TypeError(
+                'footnotes must be of type dict, str, list or tuple:{}'
+                .format(footnote)
+            )
+
+        self.footnotes.append(footnote)
 
     def _set_running_sections(
         self, running_sections: Iterable, page_width: 'Number',
@@ -293,19 +326,21 @@ class PDFDocument:
         Args:
             section (dict): a dict representing the section to be processed.
         """
-        section_style = copy(self.style)
-        section_style.update(process_style(section.get('style', {}), self.pdf))
+        pdf = self.pdf
+        section_style = {
+            **self.style, **process_style(section.get('style', {}), pdf)
+        }
         
         if 'page_numbering_offset' in section_style:
-            self.pdf.page_numbering_offset = section_style['page_numbering_offset']
+            pdf.page_numbering_offset = section_style['page_numbering_offset']
         if 'page_numbering_style' in section_style:
-            self.pdf.page_numbering_style = section_style['page_numbering_style']
+            pdf.page_numbering_style = section_style['page_numbering_style']
         if section_style.get('page_numbering_reset', False):
-            self.pdf.page_numbering_offset = -len(self.pdf.pages)
+            pdf.page_numbering_offset = -len(pdf.pages)
 
         section['style'] = section_style
 
-        self.section = self.pdf._create_content(
+        self.section = pdf._create_content(
             section, self.width, self.height, self.x, self.y
         )
 
@@ -313,46 +348,43 @@ class PDFDocument:
             k: section_style[k] for k in PAGE_PROPS if k in section_style
         }
 
+        section_running_sections = set(section.get('running_sections', []))
+
         while True:
-            page_n = len(self.pdf.pages)
+            page_n = len(pdf.pages)
 
             page_args = section_page_args.copy()
 
-            running_sections = set(section.get('running_sections', []))
+            running_sections = section_running_sections.copy()
 
             for range_dict in self.per_page:
                 if page_n in range_dict['pages']:
                     if 'style' in range_dict:
-                        page_style = range_dict['style']
-                        page_args.update({
-                            k: page_style[k] for k in PAGE_PROPS
-                            if k in page_style
-                        })
+                        page_args.update(range_dict['style'])
                     if 'running_sections' in range_dict:
                         per_page_rs = range_dict['running_sections']
-                        running_sections -= set(per_page_rs.get('exclude', []))
-                        running_sections.update(
-                            set(per_page_rs.get('include', []))
-                        )
+                        running_sections -= per_page_rs['exclude']
+                        running_sections |= per_page_rs['include']
 
-            self.pdf.setup_page(**page_args)
+            pdf.setup_page(**page_args)
 
-            page_width, page_height = self.pdf.page_width, self.pdf.page_height
-            if self.pdf.rotate_page:
+            page_width, page_height = pdf.page_width, pdf.page_height
+            if pdf.rotate_page:
                 page_width, page_height = page_height, page_width
 
-            self.x = self.pdf.margin['left']
-            self.width = page_width - self.pdf.margin['right'] - self.x
-            self.y = page_height - self.pdf.margin['top']
-            self.height = self.y - self.pdf.margin['bottom']
+            margin = pdf.margin
+            self.x = margin['left']
+            self.width = page_width - margin['right'] - self.x
+            self.y = page_height - margin['top']
+            self.height = self.y - margin['bottom']
 
             self.section.setup(self.x, self.y, self.width, self.height)
 
             self._set_running_sections(
-                running_sections, page_width, page_height, self.pdf.margin
+                running_sections, page_width, page_height, margin
             )
 
-            self.pdf.add_page()
+            pdf.add_page()
 
             self._add_content()
 
@@ -377,7 +409,9 @@ class PDFDocument:
         footnotes_obj = self._process_footnotes()
 
         if footnotes_obj is None:
-            self.pdf._add_graphics([*self.section.fills,*self.section.lines])
+            self.pdf._add_graphics(
+                chain(self.section.fills, self.section.lines)
+            )
             self.pdf._add_parts(self.section.parts)
             self.pdf.page._y -= self.section.current_height
         else:
@@ -394,7 +428,7 @@ class PDFDocument:
                 self.section.finished = False
             self.pdf._content(self.section, height=new_height)
 
-            footnotes_obj = self._process_footnotes()
+            footnotes_obj = self._process_footnotes(reuse_last=True)
 
             if footnotes_obj is not None:
                 self.pdf.page._y = self.pdf.margin['bottom'] + footnotes_height
@@ -407,23 +441,6 @@ class PDFDocument:
                 ))
                 self.pdf._content(footnotes_obj, height=self.height)
 
-    def _check_footnote(self, ids: dict, page_footnotes: list) -> None:
-        """Method that extract the footnotes from the ids passed as argument,
-        and adds them to the ``page_footnotes`` list argument.
-
-        Args:
-            ids (dict): the ids list.
-            page_footnotes (list): the list of the page footnotes to save the
-                footnotes found in the ids.
-        """
-        for id_, rects in ids.items():
-            if len(rects) == 0:
-                continue
-            if id_.startswith('$footnote:'):
-                index = int(id_[10:])
-                page_footnotes.append(self.footnotes[index])
-                self.pdf.context[id_] = len(page_footnotes)
-
     def _check_footnotes(self, page_footnotes: list) -> None:
         """Method that loops through the current section parts, extracting the
         footnotes from each part's ids.
@@ -432,9 +449,16 @@ class PDFDocument:
             page_footnotes (list): the list of the page footnotes to save the
                 footnotes found in the ids.
         """
+        footnotes, context = self.footnotes, self.pdf.context
+        footnote_ids = self._footnote_ids
         for part in self.section.parts:
-            if part['type'] == 'paragraph':
-                self._check_footnote(part['ids'], page_footnotes)
+            if part['type'] != 'paragraph':
+                continue
+            for id_, rects in part['ids'].items():
+                index = footnote_ids.get(id_)
+                if index is not None and rects:
+                    page_footnotes.append(footnotes[index])
+                    context[id_] = len(page_footnotes)
 
     def _get_footnotes_obj(self, page_footnotes: list) -> 'PDFContent':
         """Method to create the PDFContent object containing the footnotes of
@@ -461,11 +485,17 @@ class PDFDocument:
         footnote_obj.run()
         return footnote_obj
 
-    def _process_footnotes(self) -> 'PDFContent':
+    def _process_footnotes(self, reuse_last: bool=False) -> 'PDFContent':
         """Method to extract the footnotes from the current section parts, and
         create the PDFContent object containing the footnotes of
         the current page.
 
+        Args:
+            reuse_last (bool, optional): whether the PDFContent object created
+                in the last call should be returned if the footnotes are the
+                same. This is used when the section is arranged again in the
+                same page to leave room for the footnotes.
+
         Returns:
             PDFContent: object containing the footnotes.
         """
@@ -473,7 +503,14 @@ class PDFDocument:
         self._check_footnotes(page_footnotes)
         if len(page_footnotes) == 0:
             return None
-        return self._get_footnotes_obj(page_footnotes)
+        last = self._last_footnotes
+        if reuse_last and last is not None and \
+                len(last[0]) == len(page_footnotes) and \
+                all(a is b for a, b in zip(last[0], page_footnotes)):
+            return last[1]
+        footnotes_obj = self._get_footnotes_obj(page_footnotes)
+        self._last_footnotes = (page_footnotes, footnotes_obj)
+        return footnotes_obj
 
     def output(self, buffer: Any) -> None:
         """Method to create the PDF file.
@@ -169,19 +169,22 @@ class PDFTrueTypeFont(PDFFont):
     def _get_char_width(self, char: str) -> float:
         """Method to get the width of the ``char`` character string.
 
+        The glyph set creates a new glyph object every time a glyph is read, so
+        the width of each character is kept after it's read the first time.
+
         Args:
             char (str): the character.
 
         Returns:
             float: the character's width.
         """
-        index = ord(char)
-        if index in self.cmap:
-            glyph = self.cmap[index]
-            if glyph in self.glyph_set:
-                return self.glyph_set[self.cmap[ord(char)]].width
-
-        return self.glyph_set['.notdef'].width
+        width = self.char_widths.get(char)
+        if width is None:
+            glyph = self.cmap.get(ord(char))
+            if glyph not in self.glyph_set:
+                glyph = '.notdef'
+            width = self.char_widths[char] = self.glyph_set[glyph].width
+        return width
 
     def get_char_width(self, char: str) -> float:
         """See :meth:`pdfme.fonts.PDFFont.get_char_width`"""
@@ -214,6 +217,7 @@ class PDFTrueTypeFont(PDFFont):
         # TODO: cmap needs to be modifiedfor this to work
         self.cmap = self.font['cmap'].getcmap(3,1).cmap
         self.glyph_set = self.font.getGlyphSet()
+        self.char_widths = {}
 
         self.font_descriptor = self._get_font_descriptor()
 
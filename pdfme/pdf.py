@@ -1,5 +1,6 @@
 import json
 from io import BytesIO
+from itertools import chain
 from pathlib import Path
 from typing import Any, Iterable, Union
 
@@ -505,9 +506,9 @@ class PDF:
         elif isinstance(content, (list, tuple)):
             content = {'style': style, '.': content}
         elif isinstance(content, dict):
-            style_str = [k[1:] for k in content.keys() if k.startswith('.')]
-            if len(style_str) > 0:
-                style.update(parse_style_str(style_str[0], self.fonts))
+            par_key = next((k for k in content if k.startswith('.')), None)
+            if par_key is not None:
+                style.update(parse_style_str(par_key[1:], self.fonts))
             style.update(process_style(content.get('style'), self))
             content['style'] = style
         return content
@@ -769,7 +770,7 @@ class PDF:
             )
             pdf_table.run()
 
-        self._add_graphics([*pdf_table.fills, *pdf_table.lines])
+        self._add_graphics(chain(pdf_table.fills, pdf_table.lines))
         self._add_parts(pdf_table.parts)
 
         if move == 'bottom':
@@ -847,7 +848,7 @@ class PDF:
             pdf_content = self._create_content(content, width, height, x, y)
             pdf_content.run()
 
-        self._add_graphics([*pdf_content.fills,*pdf_content.lines])
+        self._add_graphics(chain(pdf_content.fills, pdf_content.lines))
         self._add_parts(pdf_content.parts)
 
         if move == 'bottom':
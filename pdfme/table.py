@@ -701,9 +701,11 @@ class PDFTable:
                     + str(element)
                 )
 
-            keys = [key for key in element.keys() if key.startswith('.')]
-            if len(keys) > 0:
-                style.update(parse_style_str(keys[0][1:], self.fonts))
+            par_key = next(
+                (key for key in element if key.startswith('.')), None
+            )
+            if par_key is not None:
+                style.update(parse_style_str(par_key[1:], self.fonts))
             style.update(process_style(element.get('style'), self.pdf))
             cell_style = {}
             attr = 'cell_margin'
@@ -791,11 +793,11 @@ class PDFTable:
 
         self._setup_cell_fill(col, cell_style, width + padd_x, rowspan)
 
-        keys = [key for key in element.keys() if key.startswith('.')]
+        is_text = any(key.startswith('.') for key in element)
 
         real_height = 0
         did_finished = False
-        if len(keys) > 0 or self._is_delayed_type(element, 'text'):
+        if is_text or self._is_delayed_type(element, 'text'):
             real_height, did_finished = self.process_text(
                 element, x, y, width, height, style, delayed
             )
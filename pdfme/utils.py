@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Any, Iterable, Union
 
 page_sizes = {
@@ -168,6 +169,27 @@ def parse_style_str(style_str: str, fonts: 'PDFFonts') -> dict:
     Returns:
         dict: A style dict like the one described in :class:`pdfme.text.PDFText`.
     """
+    style = _parse_style_str(style_str)
+    if 'f' in style and style['f'] not in fonts.fonts:
+        raise ValueError(
+            'Style element "f" must have the name of a font family'
+            ' already added.'
+        )
+    return dict(style)
+
+@lru_cache(maxsize=1024)
+def _parse_style_str(style_str: str) -> dict:
+    """Function that parses a style string for :func:`parse_style_str`.
+
+    The same style strings are used in many paragraphs, so the results are
+    cached, and the dicts returned must not be modified.
+
+    Args:
+        style_str (str): The string representing the text style.
+
+    Returns:
+        dict: The style dict.
+    """
 
     style = {}
     for attrs_str in style_str.split(';'):
@@ -197,12 +219,6 @@ def parse_style_str(style_str: str, fonts: 'PDFFonts') -> dict:
                         .format(attr, value)
                     )
             if attr == "f":
-                if value not in fonts.fonts:
-                    raise ValueError(
-                        'Style element "f" must have the name of a font family'
-                        ' already added.'
-                    )
-
                 style['f'] = value
             elif attr == "c":
                 style['c'] = PDFColor(value)
@@ -2,4 +2,7 @@ from .test_text import *
 from .test_content import *
 from .test_table import *
 from .running_section_per_page import *
-from .group_element import *
\ No newline at end of file
+from .group_element import *
+from .test_columns import *
+from .test_delayed import *
+from .test_footnotes import *
\ No newline at end of file
@@ -0,0 +1,114 @@
+import math
+
+import pytest
+
+from pdfme import PDF
+
+def make_content(content, **kwargs):
+    pdf = PDF()
+    pdf.add_page()
+    return pdf._content(content, **kwargs)
+
+def test_table_graphics_in_balanced_columns():
+    table = {'table': [['a', 'b']] * 8, 'style': {'cell_fill': 'red'}}
+    content = make_content({
+        'cols': {'count': 2, 'gap': 20},
+        'content': ['hello ' * 50, table, 'bye ' * 100]
+    })
+
+    # 16 cells plus the row split between the columns, drawn only once
+    # no matter how many times the columns were balanced.
+    assert len(content.fills) == 18
+    assert len(content.lines) == 17
+
+def test_balanced_columns_height():
+    text = ' '.join('word{}'.format(i) for i in range(150))
+    line_height = 11 * 1.1
+    for count in (2, 3):
+        content = make_content(
+            {'cols': {'count': count, 'gap': 10}, 'content': [text]}
+        )
+        part = content.pdf_content_part
+        single = make_content({'content': [text]}, width=part.col_width)
+        assert single.finished
+
+        lines_n = round(single.current_height / line_height)
+        col_height = math.ceil(lines_n / count) * line_height
+        height = part.min_y - part.max_y
+        assert col_height - 1e-9 <= height < col_height + 1
+
+def test_balanced_columns_with_unused_space():
+    def words(n):
+        return ' '.join('word{}'.format(i) for i in range(n))
+    image = {'image': 'tests/image_test.jpg'}
+    content = make_content({
+        'cols': {'count': 2}, 'content': [words(12), image, words(166), image]
+    })
+    part = content.pdf_content_part
+    assert content.finished
+    images = [p for p in content.parts if p['type'] == 'image']
+    second_x = part.min_x + part.col_width + part.cols_gap
+    assert [p['x'] for p in images] == [part.min_x, second_x]
+
+    # the space the last image leaves unused at the bottom of a column isn't
+    # part of the balanced height.
+    bottom = min(
+        p['y'] - p['height'] if p['type'] == 'paragraph' else p['y']
+        for p in content.parts
+    )
+    assert 0 <= bottom - part.max_y < 1
+
+def test_balanced_columns_with_infeasible_heights():
+    image = {'image': 'tests/image_test.jpg'}
+    group = {'group': [{'image': 'tests/image_test.jpg'}, 'caption']}
+    for element, caption_height in ((image, 0), (group, 11 * 1.1)):
+        content = make_content({
+            'cols': {'count': 2}, 'content': ['hello ' * 20, element]
+        })
+        part = content.pdf_content_part
+        assert content.finished
+        assert content.parts[0]['x'] == part.min_x
+        images = [p for p in content.parts if p['type'] == 'image']
+        assert len(images) == 1
+
+        # the evenly divided height is shorter than the image, which can't be
+        # added in the first column of the shorter passes, so the image ends
+        # in the second column, and the columns are as tall as it needs.
+        image_part = images[0]
+        second_x = part.min_x + part.col_width + part.cols_gap
+        assert image_part['x'] == pytest.approx(second_x)
+        col_height = part.min_y - image_part['y'] + caption_height
+        assert col_height <= part.min_y - part.max_y < col_height + 1
+
+def test_balancing_passes_limit():
+    text = ' '.join('word{}'.format(i) for i in range(150))
+    line_height = 11 * 1.1
+    # the box is so tall that halving the space between the evenly divided
+    # height and the full height doesn't get under 1 before balancing stops.
+    content = make_content(
+        {'cols': {'count': 2, 'gap': 10}, 'content': [text]}, height=10 ** 6
+    )
+    part = content.pdf_content_part
+    assert content.finished
+
+    # all the 27 lines are placed, above the bottom of the columns, and the
+    # columns are at least as tall as the 14 lines of the first one.
+    assert sum(p['height'] for p in content.parts) == \
+        pytest.approx(27 * line_height)
+    assert all(p['y'] - p['height'] >= part.max_y for p in content.parts)
+    assert part.min_y - part.max_y >= 14 * line_height
+
+def test_balanced_columns_without_content():
+    margins = {'margin_top': 10, 'margin_bottom': 15}
+    for cols in ({}, {'count': 2}, {'count': 3}):
+        for content in (
+            {'cols': cols, 'content': []},
+            {'cols': cols, 'content': [{'content': [], 'style': margins}]},
+            {'cols': cols, 'style': margins, 'content': [{'content': []}]},
+        ):
+            # margins don't add height to a box with nothing to place, with
+            # or without columns.
+            content = make_content(content)
+            assert content.finished
+            assert content.parts == []
+            assert content.current_height == 0
@@ -0,0 +1,25 @@
+import pytest
+
+from pdfme import PDF
+
+def test_delayed_tries_kept_out_of_element():
+    image = {'image': 'tests/image_test.jpg'}
+    group = {'group': [{'image': 'tests/image_test.jpg'}, 'caption']}
+    for element in (image, group):
+        # more layouts than the 50 tries allowed, each one delaying the
+        # element, don't add up because the count lives in the delayed copy.
+        for _ in range(60):
+            pdf = PDF()
+            pdf.add_page()
+            content = pdf._content(
+                {'content': ['hello ' * 100, element]}, height=150
+            )
+            assert not content.finished
+        assert 'tries' not in element
+
+def test_delayed_tries_limit():
+    pdf = PDF(page_size=[600, 200], margin=10)
+    pdf.add_page()
+    with pytest.raises(Exception, match='Image element could not be fitted'):
+        pdf.content({'content': [{'image': 'tests/image_test.jpg'}]})
+    assert len(pdf.pages) == 50
@@ -0,0 +1,60 @@
+from pdfme.document import PDFDocument
+
+def test_footnotes_reused_in_the_same_page():
+    shared = {'.': 'note'}
+    document = {'sections': [
+        {'content': [{'.': ['first', {'footnote': shared}]}]},
+        {'content': [{'.': ['second', {'footnote': shared}]}]},
+        {'content': [{'.': ['third', {'footnote': {'.': 'note'}}]}]},
+    ]}
+    doc = PDFDocument(document)
+    assert doc.footnotes[0] is doc.footnotes[1] is shared
+    assert doc.footnotes[2] == shared and doc.footnotes[2] is not shared
+
+    created = []
+    get_footnotes_obj = doc._get_footnotes_obj
+    def spy(page_footnotes):
+        created.append(page_footnotes)
+        return get_footnotes_obj(page_footnotes)
+    doc._get_footnotes_obj = spy
+    doc.run()
+
+    # every page is arranged again to leave room for its footnotes, and the
+    # footnotes box is only built once for each of them.
+    assert len(doc.pdf.pages) == 3
+    assert len(created) == 3
+    assert created[0][0] is created[1][0] is shared
+    assert created[2][0] is doc.footnotes[2]
+
+    # the last footnotes box is reused for the same footnotes only, not for
+    # equal ones.
+    last = doc._last_footnotes[1]
+    assert doc._process_footnotes(reuse_last=True) is last
+    doc._last_footnotes = ([{'.': 'note'}], last)
+    assert doc._process_footnotes(reuse_last=True) is not last
+    assert len(created) == 4
+
+def test_footnotes_order():
+    def note(text):
+        return {'footnote': text}
+    document = {'sections': [
+        {'content': [
+            {'.': ['a', note('1'), {'.b': ['b', note('2')]}]},
+            {'content': [
+                {'.': ['c', note('3')]},
+                {'table': [
+                    [{'.': ['d', note('4')]}, {'.': ['e', note('5')]}],
+                    [{'content': [{'.': ['f', note('6')]}]}, 'g'],
+                ]},
+            ]},
+            {'.': [note('7')]},
+        ]},
+        {'content': [{'.': ['h', note('8')]}]},
+    ]}
+    doc = PDFDocument(document)
+    assert [f['.'] for f in doc.footnotes] == [str(i) for i in range(1, 9)]
+
+    doc.run()
+    context = doc.pdf.context
+    numbers = [context['$footnote:{}'.format(i)] for i in range(8)]
+    assert numbers == [1, 2, 3, 4, 5, 6, 7, 1]